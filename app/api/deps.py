@@ -1,13 +1,13 @@
 from typing import Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 from app.core import security
 from app.core.config import settings
 from app.db.session import SessionLocal
 from app.models.user import User
+from app.services.jobs import JobRunner, job_runner
 from app.schemas.token import TokenPayload
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth")
@@ -19,11 +19,14 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+def get_job_runner() -> JobRunner:
+    return job_runner
+
 def get_current_user(db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)) -> User:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = security.decode_access_token(token)
         token_data = TokenPayload(**payload)
-    except (jwt.JWTError, ValidationError) as e:
+    except (security.TokenError, ValidationError) as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Could not validate credentials")
 
     user = db.query(User).filter(User.id == token_data.sub).first()
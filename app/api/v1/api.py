@@ -1,6 +1,7 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, products
+from app.api.v1.endpoints import auth, products, jobs
 
 api_router = APIRouter()
 api_router.include_router(auth.router, tags=["auth"])
-api_router.include_router(products.router, tags=["products"])
\ No newline at end of file
+api_router.include_router(products.router, tags=["products"])
+api_router.include_router(jobs.router, tags=["jobs"])
\ No newline at end of file
@@ -0,0 +1,57 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
+from app.services.jobs import JobRunner
+from app.services.product import ProductQuery, export_file, remove_export
+from app.schemas.job import Job, ProductImport, PriceAdjustment
+from app.api import deps
+from app.models.user import User
+
+router = APIRouter()
+
+@router.post("/jobs/products/import", response_model=Job, status_code=status.HTTP_202_ACCEPTED)
+def import_products(
+    body: ProductImport,
+    runner: JobRunner = Depends(deps.get_job_runner),
+    current_user: User = Depends(deps.get_current_user)
+):
+    return runner.submit("import_products", lambda db, progress: ProductQuery(db=db).import_products(body.products, progress))
+
+@router.post("/jobs/products/export", response_model=Job, status_code=status.HTTP_202_ACCEPTED)
+def export_products(
+    runner: JobRunner = Depends(deps.get_job_runner),
+    current_user: User = Depends(deps.get_current_user)
+):
+    return runner.submit("export_products", lambda db, progress: ProductQuery(db=db).export_products(progress), cleanup=remove_export)
+
+@router.post("/jobs/products/stats", response_model=Job, status_code=status.HTTP_202_ACCEPTED)
+def refresh_product_stats(
+    runner: JobRunner = Depends(deps.get_job_runner),
+    current_user: User = Depends(deps.get_current_user)
+):
+    return runner.submit("product_stats", lambda db, progress: ProductQuery(db=db).get_product_stats())
+
+@router.post("/jobs/products/prices", response_model=Job, status_code=status.HTTP_202_ACCEPTED)
+def adjust_prices(
+    body: PriceAdjustment,
+    runner: JobRunner = Depends(deps.get_job_runner),
+    current_user: User = Depends(deps.get_current_user)
+):
+    return runner.submit("adjust_prices", lambda db, progress: ProductQuery(db=db).adjust_prices(body.percentage, body.category))
+
+@router.get("/jobs/{job_id}", response_model=Job)
+def get_job(
+    job_id: UUID,
+    runner: JobRunner = Depends(deps.get_job_runner),
+    current_user: User = Depends(deps.get_current_user)
+):
+    return runner.get(job_id)
+
+@router.get("/jobs/{job_id}/file", response_class=FileResponse)
+def download_job_file(
+    job_id: UUID,
+    runner: JobRunner = Depends(deps.get_job_runner),
+    current_user: User = Depends(deps.get_current_user)
+):
+    job = runner.get(job_id)
+    return FileResponse(export_file(job), media_type="application/x-ndjson", filename=job.result["file"])
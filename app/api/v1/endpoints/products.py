@@ -1,5 +1,7 @@
+from typing import Optional
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.services.product import ProductQuery
 from app.schemas.product import Product, ProductCreate
 from app.api import deps
@@ -9,20 +11,22 @@ router = APIRouter()
 
 @router.get("/products", response_model=list[Product])
 def get_all_products(
+    category: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    product_query = ProductQuery(db=db)
-    return product_query.get_all_products()
+    product_query = ProductQuery(db=db, lightweight=settings.PRODUCT_LIGHTWEIGHT_READS)
+    return product_query.get_all_products_coalesced(category)
 
 @router.get("/products/{name}", response_model=Product)
 def get_product(
     name: str,
+    category: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    product_query = ProductQuery(db=db)
-    return product_query.select_product(name)
+    product_query = ProductQuery(db=db, lightweight=settings.PRODUCT_LIGHTWEIGHT_READS)
+    return product_query.select_product_coalesced(name, category)
 
 @router.post("/products", response_model=Product)
 def create_product(
@@ -1,4 +1,5 @@
 import os 
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -8,8 +9,32 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_BACKEND: Literal["jose", "pyjwt"] = "jose"
+    TOKEN_CACHE_SIZE: int = 10000
     SQLALCHEMY_DATABASE_URL: str = os.getenv("SQLALCHEMY_DATABASE_URL")
 
+    # Agrupamento de leituras concorrentes idênticas de produtos (single-flight)
+    PRODUCT_READ_COALESCING: bool = True
+    PRODUCT_READ_COALESCING_TIMEOUT: float = 5.0
+
+    # Leituras dos endpoints GET retornam Rows do Core em vez de instâncias ORM
+    PRODUCT_LIGHTWEIGHT_READS: bool = True
+    # Só tem efeito com o driver psycopg (3), que já prepara no servidor statements executados 5 vezes;
+    # definido, substitui esse limite (None mantém o padrão do driver)
+    DB_PREPARE_THRESHOLD: Optional[int] = None
+
+    # Jobs em background (importação, exportação, estatísticas, reajuste de preços)
+    JOB_WORKERS: int = 2
+    JOB_MAX_PENDING: int = 100
+    JOB_RETENTION: int = 1000
+    JOB_RETENTION_SECONDS: Optional[float] = 3600
+    JOB_BATCH_SIZE: int = 1000
+    JOB_EXPORT_DIR: str = "exports"
+
+    # Particionamento da tabela products (PostgreSQL): none, hash_id, hash_category ou list_category
+    PRODUCT_PARTITIONING: Literal["none", "hash_id", "hash_category", "list_category"] = "none"
+    PRODUCT_HASH_PARTITIONS: int = 16
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=True)
 
 settings = Settings()
\ No newline at end of file
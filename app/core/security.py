@@ -3,9 +3,44 @@ from typing import Any, Union
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.token_cache import VerifiedTokenCache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+class TokenError(Exception):
+    pass
+
+# Backends de JWT intercambiáveis (selecionados por settings.JWT_BACKEND)
+class JoseBackend:
+    def encode(self, claims: dict, key: str, algorithm: str) -> str:
+        return jwt.encode(claims, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict:
+        try:
+            return jwt.decode(token, key, algorithms=algorithms)
+        except jwt.JWTError as e:
+            raise TokenError(str(e)) from e
+
+class PyJWTBackend:
+    # Requer o pacote PyJWT (`poetry add pyjwt`), que não é dependência obrigatória
+    def __init__(self):
+        import jwt as pyjwt
+        self.pyjwt = pyjwt
+
+    def encode(self, claims: dict, key: str, algorithm: str) -> str:
+        return self.pyjwt.encode(claims, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict:
+        try:
+            return self.pyjwt.decode(token, key, algorithms=algorithms)
+        except self.pyjwt.PyJWTError as e:
+            raise TokenError(str(e)) from e
+
+JWT_BACKENDS = {"jose": JoseBackend, "pyjwt": PyJWTBackend}
+
+jwt_backend = JWT_BACKENDS[settings.JWT_BACKEND]()
+token_cache = VerifiedTokenCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -19,5 +54,13 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
\ No newline at end of file
+    encoded_jwt = jwt_backend.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return encoded_jwt
+
+def decode_access_token(token: str) -> dict:
+    # Tokens já verificados são servidos do cache até o seu `exp`
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt_backend.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        token_cache.put(token, payload, payload.get("exp"))
+    return payload
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+class SingleFlight:
+    """Agrupa chamadas concorrentes com a mesma chave em uma única execução.
+
+    O primeiro chamador (líder) executa a função; quem chega enquanto ela ainda
+    está em andamento (followers) aguarda e compartilha o mesmo resultado ou exceção.
+    Nada é cacheado: quando a chamada termina, o próximo chamador inicia outra.
+    Threads e tasks asyncio do mesmo worker compartilham as mesmas chamadas.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                return call, False
+            call = Future()
+            self._calls[key] = call
+            return call, True
+
+    def _forget(self, key: Hashable, call: Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def _run(self, key: Hashable, call: Future, fn: Callable[[], Any]) -> None:
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key, call)
+            call.set_exception(e)
+        else:
+            self._forget(key, call)
+            call.set_result(result)
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        # Followers esperam no máximo `timeout` segundos (TimeoutError); o líder sempre executa fn
+        call, leader = self._join(key)
+        if leader:
+            self._run(key, call, fn)
+        call.exception(timeout=timeout)
+        return self._result(call, leader)
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        # fn é bloqueante (ex.: query síncrona), então o líder a executa no executor padrão do loop
+        call, leader = self._join(key)
+        if leader:
+            asyncio.get_running_loop().run_in_executor(None, self._run, key, call, fn)
+        # asyncio.wait não cancela o future: o timeout/cancelamento de um follower não afeta a chamada compartilhada
+        waiter = asyncio.wrap_future(call)
+        waiter.add_done_callback(lambda f: f.cancelled() or f.exception())
+        await asyncio.wait([waiter], timeout=timeout)
+        if not call.done():
+            raise TimeoutError()
+        return self._result(call, leader)
+
+    @staticmethod
+    def _result(call: Future, leader: bool) -> Any:
+        error = call.exception()
+        if error is None:
+            return call.result()
+        if leader:
+            raise error
+        # Cada follower levanta sua própria cópia: re-levantar a exceção compartilhada acumularia
+        # no mesmo __traceback__ os frames (e variáveis locais) de todos os followers, de várias threads
+        raise _copy_exception(error) from error
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+def _copy_exception(error: BaseException) -> BaseException:
+    # Copia sem chamar __init__, que pode exigir argumentos (ex.: HTTPException(status_code=...))
+    copy = type(error).__new__(type(error))
+    copy.args = error.args
+    copy.__dict__.update(error.__dict__)
+    return copy
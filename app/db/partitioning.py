@@ -0,0 +1,101 @@
+"""Ferramentas de particionamento da tabela products (PostgreSQL 13+).
+
+Uso:
+    poetry run python -m app.db.partitioning create-table
+    poetry run python -m app.db.partitioning add-category "Eletrônicos" "Livros"
+    poetry run python -m app.db.partitioning list
+"""
+import argparse
+import hashlib
+import re
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from app.core.config import settings
+from app.db.session import engine
+from app.models.product import Product
+
+def quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+def partition_name(table: str, category: str) -> str:
+    # Nome derivado da categoria + hash curto, para evitar colisões e o limite de 63 caracteres
+    slug = re.sub(r"[^a-z0-9]+", "_", category.lower()).strip("_")[:40]
+    digest = hashlib.sha1(category.encode()).hexdigest()[:8]
+    return f"{table}_{slug}_{digest}" if slug else f"{table}_{digest}"
+
+def hash_partition_statements(table: str, modulus: int) -> list[str]:
+    return [
+        f'CREATE TABLE IF NOT EXISTS "{table}_p{remainder}" PARTITION OF "{table}" '
+        f"FOR VALUES WITH (MODULUS {modulus}, REMAINDER {remainder})"
+        for remainder in range(modulus)
+    ]
+
+def default_partition_statement(table: str) -> str:
+    return f'CREATE TABLE IF NOT EXISTS "{table}_default" PARTITION OF "{table}" DEFAULT'
+
+def category_partition_statements(table: str, category: str) -> list[str]:
+    # Move as linhas da categoria que já estão na partição DEFAULT para a nova partição;
+    # sem isso o PostgreSQL recusa a criação da partição
+    name = partition_name(table, category)
+    value = quote_literal(category)
+    return [
+        f'ALTER TABLE "{table}" DETACH PARTITION "{table}_default"',
+        f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        f'INSERT INTO "{name}" SELECT * FROM "{table}_default" WHERE category = {value}',
+        f'DELETE FROM "{table}_default" WHERE category = {value}',
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" FOR VALUES IN ({value})',
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{table}_default" DEFAULT',
+    ]
+
+def execute_ddl(connection: Connection, statement: str) -> None:
+    # no_parameters: os literais da categoria podem conter ":" ou "%"
+    connection.execution_options(no_parameters=True).exec_driver_sql(statement)
+
+def list_partitions(connection: Connection, table: str) -> list[tuple[str, str]]:
+    rows = connection.execute(text(
+        "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+        "FROM pg_inherits JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = :table ORDER BY child.relname"
+    ), {"table": table})
+    return [(name, bound) for name, bound in rows]
+
+def create_table(connection: Connection) -> None:
+    table = Product.__tablename__
+    Product.__table__.create(connection, checkfirst=True)
+    if settings.PRODUCT_PARTITIONING in ("hash_id", "hash_category"):
+        statements = hash_partition_statements(table, settings.PRODUCT_HASH_PARTITIONS)
+    elif settings.PRODUCT_PARTITIONING == "list_category":
+        statements = [default_partition_statement(table)]
+    else:
+        statements = []
+    for statement in statements:
+        execute_ddl(connection, statement)
+
+def add_categories(connection: Connection, categories: list[str]) -> None:
+    if settings.PRODUCT_PARTITIONING != "list_category":
+        raise SystemExit("add-category requer PRODUCT_PARTITIONING=list_category")
+    for category in categories:
+        for statement in category_partition_statements(Product.__tablename__, category):
+            execute_ddl(connection, statement)
+
+def main():
+    parser = argparse.ArgumentParser(description="Particionamento da tabela products")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("create-table", help="cria a tabela particionada e suas partições iniciais")
+    add_category = subparsers.add_parser("add-category", help="cria e anexa partições de categoria (LIST)")
+    add_category.add_argument("categories", nargs="+")
+    subparsers.add_parser("list", help="lista as partições existentes")
+    args = parser.parse_args()
+
+    # engine.begin(): cada comando roda em uma única transação
+    with engine.begin() as connection:
+        if args.command == "create-table":
+            create_table(connection)
+        elif args.command == "add-category":
+            add_categories(connection, args.categories)
+        for name, bound in list_partitions(connection, Product.__tablename__):
+            print(f"{name}: {bound}")
+
+if __name__ == "__main__":
+    main()
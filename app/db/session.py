@@ -1,11 +1,21 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from app.core.config import settings
 
+# psycopg (3) prepara no servidor os statements repetidos; o psycopg2 não suporta prepared statements
+connect_args = {}
+if settings.DB_PREPARE_THRESHOLD is not None and make_url(settings.SQLALCHEMY_DATABASE_URL).get_driver_name() == "psycopg":
+    connect_args["prepare_threshold"] = settings.DB_PREPARE_THRESHOLD
+
 # Engine com pool de conexões configurado
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, pool_size=5, max_overflow=10)
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, pool_size=5, max_overflow=10, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Engine separado para jobs em background: uma conexão por worker, sem overflow,
+# para que jobs pesados não consumam as conexões das requisições interativas
+job_engine = create_engine(settings.SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, pool_size=settings.JOB_WORKERS, max_overflow=0, connect_args=connect_args)
+JobSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=job_engine)
+
 class Base(DeclarativeBase):
     pass
 
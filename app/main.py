@@ -1,8 +1,16 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.services.jobs import job_runner
 
-app = FastAPI(title=settings.PROJECT_NAME, openapi_url=f"{settings.API_V1_STR}/openapi.json")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Cancela jobs pendentes e aguarda os que estão em execução
+    job_runner.shutdown()
+
+app = FastAPI(title=settings.PROJECT_NAME, openapi_url=f"{settings.API_V1_STR}/openapi.json", lifespan=lifespan)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -1,9 +1,21 @@
 from sqlalchemy import Column, Integer, String, Float, DateTime, text
 from sqlalchemy.dialects.postgresql import UUID
+from app.core.config import settings
 from app.db.session import Base
 
+# Estratégias de particionamento declarativo (PostgreSQL), selecionadas por settings.PRODUCT_PARTITIONING
+PARTITION_BY = {
+    "hash_id": "HASH (id)",
+    "hash_category": "HASH (category)",
+    "list_category": "LIST (category)",
+}
+
+# A chave de particionamento precisa fazer parte da chave primária
+PARTITION_BY_CATEGORY = settings.PRODUCT_PARTITIONING in ("hash_category", "list_category")
+
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = {"postgresql_partition_by": PARTITION_BY[settings.PRODUCT_PARTITIONING]} if settings.PRODUCT_PARTITIONING in PARTITION_BY else {}
 
     # Campos gerados pelo PostgreSQL (DEFAULT e TRIGGER)
     id = Column(UUID(as_uuid=True), primary_key=True, nullable=False, server_default=text("gen_random_uuid()"))
@@ -12,6 +24,6 @@ class Product(Base):
     
     # Campos da aplicação
     name = Column(String(50), nullable=False, index=True)
-    category = Column(String(50), nullable=False, index=True)
+    category = Column(String(50), nullable=False, index=True, primary_key=PARTITION_BY_CATEGORY)
     price = Column(Float, nullable=False, index=True)
     amount = Column(Integer, nullable=False, index=True)
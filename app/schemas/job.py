@@ -0,0 +1,30 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+from app.schemas.product import ProductCreate
+
+class JobStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+class Job(BaseModel):
+    id: UUID
+    type: str
+    status: JobStatus = JobStatus.pending
+    progress: float = Field(0.0, ge=0, le=1, description="Fração concluída do job (0 a 1)")
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class ProductImport(BaseModel):
+    products: list[ProductCreate] = Field(..., min_length=1, description="Produtos a serem importados")
+
+class PriceAdjustment(BaseModel):
+    percentage: float = Field(..., gt=-100, description="Reajuste percentual (ex.: 10 para +10%, -5 para -5%)")
+    category: Optional[str] = Field(None, min_length=1, max_length=50, description="Restringe o reajuste a uma categoria")
@@ -0,0 +1,139 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.session import JobSessionLocal
+from app.schemas.job import Job, JobStatus
+
+# Recebe a sessão do job e uma função progress(done, total)
+JobFunction = Callable[[Session, Callable[[int, int], None]], Any]
+# Recebe o resultado de um job bem-sucedido quando ele é descartado (ex.: apaga o arquivo exportado)
+JobCleanup = Callable[[Any], None]
+
+class JobRunner:
+    """Executa operações pesadas fora da thread da requisição.
+
+    Os jobs rodam em um pool de threads limitado, cada um com uma sessão do
+    `session_factory` (por padrão ligado a um engine próprio, com uma conexão
+    por worker). O estado dos jobs fica em memória no processo.
+
+    Jobs finalizados são descartados além de `retention` jobs ou após
+    `retention_seconds`; o `cleanup` de um job bem-sucedido roda quando ele é
+    descartado ou no shutdown, quando o estado em memória se perde.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_workers: int,
+        max_pending: int,
+        retention: int,
+        retention_seconds: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retention = retention
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[uuid.UUID, Job] = OrderedDict()
+        self._cleanups: dict[uuid.UUID, JobCleanup] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, job_type: str, fn: JobFunction, cleanup: Optional[JobCleanup] = None) -> Job:
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if job.status == JobStatus.pending)
+            if pending >= self.max_pending:
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Too many pending jobs")
+            job = Job(id=uuid.uuid4(), type=job_type, created_at=datetime.now(timezone.utc))
+            self._jobs[job.id] = job
+            if cleanup is not None:
+                self._cleanups[job.id] = cleanup
+            evicted = self._evict_finished()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            self._executor.submit(self._run, job.id, fn)
+            job = job.model_copy()
+        self._cleanup(evicted)
+        return job
+
+    def get(self, job_id: uuid.UUID) -> Job:
+        with self._lock:
+            evicted = self._evict_finished()
+            job = self._jobs.get(job_id)
+            job = job.model_copy() if job else None
+        self._cleanup(evicted)
+        if not job:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.status in (JobStatus.succeeded, JobStatus.failed)]
+            evicted = [self._pop(job_id) for job_id in finished]
+        self._cleanup(evicted)
+
+    def _update(self, job_id: uuid.UUID, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                for field, value in fields.items():
+                    setattr(job, field, value)
+
+    def _pop(self, job_id: uuid.UUID) -> tuple[Optional[JobCleanup], Job]:
+        return self._cleanups.pop(job_id, None), self._jobs.pop(job_id)
+
+    def _evict_finished(self) -> list[tuple[Optional[JobCleanup], Job]]:
+        # Descarta os jobs finalizados expirados e, quando o limite de retenção é atingido, os mais antigos;
+        # chamado com o lock, devolve os jobs descartados para o cleanup rodar fora dele
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in (JobStatus.succeeded, JobStatus.failed)]
+        evict = finished[:max(0, len(self._jobs) - self.retention)]
+        if self.retention_seconds is not None:
+            now = datetime.now(timezone.utc)
+            evict += [
+                job_id for job_id in finished[len(evict):]
+                if (now - self._jobs[job_id].finished_at).total_seconds() >= self.retention_seconds
+            ]
+        return [self._pop(job_id) for job_id in evict]
+
+    @staticmethod
+    def _cleanup(evicted: list[tuple[Optional[JobCleanup], Job]]) -> None:
+        for cleanup, job in evicted:
+            if cleanup is not None and job.status == JobStatus.succeeded:
+                cleanup(job.result)
+
+    def _run(self, job_id: uuid.UUID, fn: JobFunction) -> None:
+        def progress(done: int, total: int) -> None:
+            self._update(job_id, progress=min(done / total, 1.0) if total else 1.0)
+
+        self._update(job_id, status=JobStatus.running, started_at=datetime.now(timezone.utc))
+        db = self.session_factory()
+        try:
+            result = fn(db, progress)
+        except HTTPException as e:
+            db.rollback()
+            self._update(job_id, status=JobStatus.failed, error=e.detail, finished_at=datetime.now(timezone.utc))
+        except Exception as e:
+            db.rollback()
+            self._update(job_id, status=JobStatus.failed, error=str(e) or type(e).__name__, finished_at=datetime.now(timezone.utc))
+        else:
+            self._update(job_id, status=JobStatus.succeeded, progress=1.0, result=result, finished_at=datetime.now(timezone.utc))
+        finally:
+            db.close()
+
+job_runner = JobRunner(
+    session_factory=JobSessionLocal,
+    max_workers=settings.JOB_WORKERS,
+    max_pending=settings.JOB_MAX_PENDING,
+    retention=settings.JOB_RETENTION,
+    retention_seconds=settings.JOB_RETENTION_SECONDS,
+)
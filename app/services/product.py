@@ -1,15 +1,66 @@
+from app.schemas.job import Job, JobStatus
 from app.schemas.product import Product, ProductCreate
 from app.models.product import Product as ProductModel
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+import os
+import uuid
+from functools import lru_cache
+from typing import Callable, Optional
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+# Leituras concorrentes idênticas compartilham uma única query por worker
+product_reads = SingleFlight()
+
+class ProductStatements:
+    # Statements dos caminhos quentes, montados uma única vez com bindparam; a cada execução
+    # o SQLAlchemy só troca os parâmetros e reaproveita a compilação do seu cache
+    def __init__(self, model):
+        table = model.__table__
+        by_name = model.name == bindparam("name")
+        by_category = model.category == bindparam("category")
+
+        # Instâncias ORM (update/delete e leituras que precisam do modelo)
+        self.by_name = select(model).where(by_name).limit(1)
+        self.by_name_and_category = select(model).where(by_name, by_category).limit(1)
+        self.all = select(model)
+        self.by_category = select(model).where(by_category)
+
+        # Rows do Core, sem hidratação ORM (leituras somente para serialização)
+        self.rows_by_name = select(table).where(table.c.name == bindparam("name")).limit(1)
+        self.rows_by_name_and_category = select(table).where(table.c.name == bindparam("name"), table.c.category == bindparam("category")).limit(1)
+        self.rows_all = select(table)
+        self.rows_by_category = select(table).where(table.c.category == bindparam("category"))
+
+@lru_cache
+def product_statements(model) -> ProductStatements:
+    return ProductStatements(model)
+
 class ProductQuery:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, lightweight: bool = False):
+        # lightweight: leituras retornam Rows do Core em vez de instâncias ORM
         self.db = db
+        self.lightweight = lightweight
 
-    def select_product(self, name: str) -> Product:
-        product_model = self.db.query(ProductModel).filter(ProductModel.name == name).first()
+    @property
+    def statements(self) -> ProductStatements:
+        return product_statements(ProductModel)
+
+    def _find_by_name(self, name: str) -> Optional[ProductModel]:
+        return self.db.execute(self.statements.by_name, {"name": name}).scalars().first()
+
+    def select_product(self, name: str, category: Optional[str] = None) -> Product:
+        statements = self.statements
+        # Filtrar pela chave de particionamento permite ao PostgreSQL podar partições
+        if self.lightweight:
+            statement = statements.rows_by_name_and_category if category else statements.rows_by_name
+            product_model = self.db.execute(statement, {"name": name, "category": category}).first()
+        else:
+            statement = statements.by_name_and_category if category else statements.by_name
+            product_model = self.db.execute(statement, {"name": name, "category": category}).scalars().first()
         if not product_model:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
         return product_model
@@ -34,7 +85,7 @@ class ProductQuery:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     def update_product(self, name: str, product: ProductCreate) -> Product:
-        product_model = self.db.query(ProductModel).filter(ProductModel.name == name).first()
+        product_model = self._find_by_name(name)
         if not product_model:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")       
         try:
@@ -53,7 +104,7 @@ class ProductQuery:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     def delete_product(self, name: str) -> Product:
-        product_model = self.db.query(ProductModel).filter(ProductModel.name == name).first()
+        product_model = self._find_by_name(name)
         if not product_model:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
         try:
@@ -64,5 +115,129 @@ class ProductQuery:
             self.db.rollback()
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
-    def get_all_products(self) -> list[Product]:
-        return self.db.query(ProductModel).all()
\ No newline at end of file
+    def get_all_products(self, category: Optional[str] = None) -> list[Product]:
+        statements = self.statements
+        if self.lightweight:
+            statement = statements.rows_by_category if category else statements.rows_all
+            return list(self.db.execute(statement, {"category": category}))
+        statement = statements.by_category if category else statements.all
+        return list(self.db.execute(statement, {"category": category}).scalars())
+
+    def select_product_coalesced(self, name: str, category: Optional[str] = None) -> Product:
+        # Retorna o schema (e não o modelo ORM), pois o resultado é compartilhado entre requisições
+        return self._coalesce(("select_product", name, category), lambda: Product.model_validate(self.select_product(name, category)))
+
+    def get_all_products_coalesced(self, category: Optional[str] = None) -> list[Product]:
+        return self._coalesce(("get_all_products", category), lambda: [Product.model_validate(p) for p in self.get_all_products(category)])
+
+    def _coalesce(self, key: tuple, fn):
+        # Encerra a transação da requisição (aberta pela autenticação) e devolve a conexão ao pool:
+        # followers aguardam o líder sem segurar conexão, e o líder só a usa durante a query.
+        # Só é usado em leituras, então não há alterações pendentes a perder
+        self.db.rollback()
+
+        def run():
+            try:
+                return fn()
+            finally:
+                self.db.rollback()
+
+        if not settings.PRODUCT_READ_COALESCING:
+            return run()
+        try:
+            return product_reads.do(key, run, timeout=settings.PRODUCT_READ_COALESCING_TIMEOUT)
+        except TimeoutError:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Product read timed out")
+
+    # Operações pesadas, executadas como jobs em background (app/services/jobs.py)
+    def import_products(self, products: list[ProductCreate], progress: Optional[Callable[[int, int], None]] = None) -> dict:
+        # Importação atômica: os lotes são enviados com flush e confirmados em um único commit no final;
+        # qualquer falha desfaz a importação inteira e nenhum produto é gravado
+        total = len(products)
+        try:
+            for start in range(0, total, settings.JOB_BATCH_SIZE):
+                batch = products[start:start + settings.JOB_BATCH_SIZE]
+                self.db.add_all([ProductModel(**product.model_dump()) for product in batch])
+                self.db.flush()
+                # Libera as instâncias já enviadas, para a sessão não crescer com o tamanho da importação
+                self.db.expunge_all()
+                if progress:
+                    progress(start + len(batch), total)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Product already exists; import rolled back, no products were imported")
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error; import rolled back, no products were imported")
+        return {"imported": total}
+
+    def export_products(self, progress: Optional[Callable[[int, int], None]] = None) -> dict:
+        # Grava em disco (JSON Lines) à medida que lê: o catálogo nunca fica inteiro em memória,
+        # e o resultado do job guarda apenas o nome do arquivo, a quantidade de linhas e o tamanho
+        total = self.db.query(func.count(ProductModel.id)).scalar()
+        os.makedirs(settings.JOB_EXPORT_DIR, exist_ok=True)
+        path = os.path.join(settings.JOB_EXPORT_DIR, f"products-{uuid.uuid4()}.jsonl")
+        exported = 0
+        try:
+            with open(f"{path}.partial", "w", encoding="utf-8") as file:
+                rows = self.db.execute(self.statements.rows_all.execution_options(yield_per=settings.JOB_BATCH_SIZE))
+                for row in rows:
+                    file.write(Product.model_validate(row).model_dump_json() + "\n")
+                    exported += 1
+                    if progress and exported % settings.JOB_BATCH_SIZE == 0:
+                        progress(exported, total)
+            os.replace(f"{path}.partial", path)
+        except BaseException:
+            if os.path.exists(f"{path}.partial"):
+                os.remove(f"{path}.partial")
+            raise
+        return {"file": os.path.basename(path), "rows": exported, "size": os.path.getsize(path)}
+
+    def get_product_stats(self) -> list[dict]:
+        rows = (
+            self.db.query(
+                ProductModel.category,
+                func.count(ProductModel.id),
+                func.sum(ProductModel.amount),
+                func.avg(ProductModel.price),
+                func.sum(ProductModel.price * ProductModel.amount),
+            )
+            .group_by(ProductModel.category)
+            .order_by(ProductModel.category)
+            .all()
+        )
+        return [
+            {"category": category, "products": products, "amount": amount, "average_price": average_price, "stock_value": stock_value}
+            for category, products, amount, average_price, stock_value in rows
+        ]
+
+    def adjust_prices(self, percentage: float, category: Optional[str] = None) -> dict:
+        statement = update(ProductModel).values(price=ProductModel.price * (1 + percentage / 100))
+        if category:
+            statement = statement.where(ProductModel.category == category)
+        try:
+            result = self.db.execute(statement.execution_options(synchronize_session=False))
+            self.db.commit()
+            return {"updated": result.rowcount}
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+def export_path(file: str) -> str:
+    # O resultado do job guarda só o nome do arquivo; o diretório vem sempre de JOB_EXPORT_DIR
+    return os.path.join(settings.JOB_EXPORT_DIR, os.path.basename(file))
+
+def export_file(job: Job) -> str:
+    if job.type != "export_products" or job.status != JobStatus.succeeded:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export file not found")
+    path = export_path(job.result["file"])
+    if not os.path.exists(path):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export file not found")
+    return path
+
+def remove_export(result: dict) -> None:
+    # Cleanup do job de exportação: apaga o arquivo quando o job é descartado
+    path = export_path(result["file"])
+    if os.path.exists(path):
+        os.remove(path)
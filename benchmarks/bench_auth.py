@@ -0,0 +1,45 @@
+"""Microbenchmark do custo de autenticação por requisição.
+
+Compara a verificação completa do JWT (por backend disponível) com a
+verificação servida pelo cache de tokens já verificados.
+
+Uso:
+    SECRET_KEY=... poetry run python -m benchmarks.bench_auth --iterations 20000
+"""
+import argparse
+import time
+
+from app.core import security
+from app.core.config import settings
+
+def bench(label: str, fn, iterations: int) -> None:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>24}: {elapsed / iterations * 1_000_000:>8.2f} µs/req")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = security.create_access_token(1)
+
+    for name, backend_class in security.JWT_BACKENDS.items():
+        try:
+            backend = backend_class()
+        except ImportError:
+            print(f"{name:>24}: não instalado")
+            continue
+        bench(
+            f"{name} (sem cache)",
+            lambda: backend.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]),
+            args.iterations,
+        )
+
+    security.token_cache.clear()
+    bench("cache de tokens", lambda: security.decode_access_token(token), args.iterations)
+
+if __name__ == "__main__":
+    main()
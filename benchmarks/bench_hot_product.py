@@ -0,0 +1,92 @@
+"""Benchmark de leitura de um produto "quente" com e sem single-flight.
+
+Simula N requisições concorrentes para o mesmo nome de produto, como no
+endpoint GET /products/{name}: cada requisição pega uma conexão de um pool
+limitado (pool_size + max_overflow de app/db/session.py) para a consulta de
+autenticação e depois faz a leitura do produto. Compara:
+
+- sem agrupamento: cada requisição faz a sua query na própria conexão;
+- single-flight segurando a conexão: followers aguardam o líder com a conexão
+  da autenticação ainda em uso (comportamento sem o rollback em `_coalesce`);
+- single-flight liberando a conexão: a requisição devolve a conexão antes de
+  aguardar e só o líder pega uma conexão para a query (comportamento atual).
+
+Uso:
+    poetry run python -m benchmarks.bench_hot_product --requests 2000 --threads 200
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.singleflight import SingleFlight
+
+POOL_CONNECTIONS = 15
+MODES = {
+    "none": "sem agrupamento",
+    "hold": "single-flight segurando",
+    "release": "single-flight liberando",
+}
+
+def run(requests: int, threads: int, latency: float, mode: str) -> dict:
+    pool = threading.BoundedSemaphore(POOL_CONNECTIONS)
+    flight = SingleFlight()
+    queries = 0
+    counter_lock = threading.Lock()
+
+    def select_product():
+        nonlocal queries
+        with counter_lock:
+            queries += 1
+        time.sleep(latency)
+        return {"name": "Produto Quente"}
+
+    def select_product_with_connection():
+        with pool:
+            return select_product()
+
+    def request(_):
+        start = time.perf_counter()
+        pool.acquire()
+        try:
+            time.sleep(latency)  # consulta de autenticação (get_current_user)
+            if mode == "none":
+                select_product()
+            elif mode == "hold":
+                flight.do(("select_product", "Produto Quente"), select_product)
+        finally:
+            pool.release()
+        if mode == "release":
+            flight.do(("select_product", "Produto Quente"), select_product_with_connection)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = sorted(executor.map(request, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "queries": queries,
+        "throughput": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005, help="latência simulada de cada query (s)")
+    args = parser.parse_args()
+
+    for mode, label in MODES.items():
+        result = run(args.requests, args.threads, args.latency, mode)
+        print(
+            f"{label:>24}: {result['queries']:>5} leituras do produto  "
+            f"{result['throughput']:>9.0f} req/s  "
+            f"p50 {result['p50_ms']:.1f} ms  p99 {result['p99_ms']:.1f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark de escrita e de leitura por categoria com e sem particionamento.
+
+Para cada estratégia, recria a tabela products em um schema descartável
+(bench_partitioning), carrega `--rows` produtos distribuídos em `--categories`
+categorias e mede a carga em massa, inserts unitários e scans por categoria.
+Requer um PostgreSQL 13+ dedicado (o schema é apagado ao final).
+
+Uso:
+    poetry run python -m benchmarks.bench_partitioning --url postgresql://... --rows 1000000 --categories 200
+"""
+import argparse
+import random
+import time
+
+from sqlalchemy import create_engine, text
+
+from app.db.partitioning import category_partition_statements, default_partition_statement, execute_ddl, hash_partition_statements
+from app.models.product import PARTITION_BY
+
+SCHEMA = "bench_partitioning"
+TABLE = "products"
+
+def create_table(connection, strategy: str, categories: list[str], partitions: int) -> None:
+    primary_key = "id, category" if strategy in ("hash_category", "list_category") else "id"
+    partition_by = f"PARTITION BY {PARTITION_BY[strategy]}" if strategy in PARTITION_BY else ""
+    execute_ddl(connection, f"""
+        CREATE TABLE "{TABLE}" (
+            id uuid NOT NULL DEFAULT gen_random_uuid(),
+            created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            name varchar(50) NOT NULL,
+            category varchar(50) NOT NULL,
+            price float NOT NULL,
+            amount integer NOT NULL,
+            PRIMARY KEY ({primary_key})
+        ) {partition_by}
+    """)
+    execute_ddl(connection, f'CREATE INDEX ON "{TABLE}" (name)')
+    execute_ddl(connection, f'CREATE INDEX ON "{TABLE}" (category)')
+    if strategy in ("hash_id", "hash_category"):
+        for statement in hash_partition_statements(TABLE, partitions):
+            execute_ddl(connection, statement)
+    elif strategy == "list_category":
+        execute_ddl(connection, default_partition_statement(TABLE))
+        for category in categories:
+            for statement in category_partition_statements(TABLE, category):
+                execute_ddl(connection, statement)
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+def run(engine, strategy: str, rows: int, categories: list[str], partitions: int, scans: int) -> dict:
+    with engine.begin() as connection:
+        execute_ddl(connection, f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        execute_ddl(connection, f"CREATE SCHEMA {SCHEMA}")
+        execute_ddl(connection, f"SET search_path TO {SCHEMA}")
+        create_table(connection, strategy, categories, partitions)
+
+    with engine.begin() as connection:
+        execute_ddl(connection, f"SET search_path TO {SCHEMA}")
+        bulk_load = timed(lambda: connection.execute(text(
+            f'INSERT INTO "{TABLE}" (name, category, price, amount) '
+            "SELECT 'Produto ' || i, 'categoria_' || (i % :categories), 1 + random() * 1000, (random() * 100)::int "
+            "FROM generate_series(1, :rows) AS i"
+        ), {"categories": len(categories), "rows": rows}))
+        execute_ddl(connection, f'ANALYZE "{TABLE}"')
+
+    insert = text(f'INSERT INTO "{TABLE}" (name, category, price, amount) VALUES (:name, :category, :price, :amount)')
+    with engine.begin() as connection:
+        execute_ddl(connection, f"SET search_path TO {SCHEMA}")
+        single_inserts = timed(lambda: [
+            connection.execute(insert, {"name": f"Novo {i}", "category": random.choice(categories), "price": 10.0, "amount": 1})
+            for i in range(1000)
+        ])
+
+    scan = text(f'SELECT count(*), avg(price) FROM "{TABLE}" WHERE category = :category')
+    with engine.connect() as connection:
+        execute_ddl(connection, f"SET search_path TO {SCHEMA}")
+        category_scans = timed(lambda: [connection.execute(scan, {"category": random.choice(categories)}).one() for _ in range(scans)])
+
+    with engine.begin() as connection:
+        execute_ddl(connection, f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {
+        "bulk_load_s": bulk_load,
+        "inserts_s": single_inserts,
+        "scan_ms": category_scans / scans * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True, help="URL de um PostgreSQL dedicado ao benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--partitions", type=int, default=16, help="partições HASH")
+    parser.add_argument("--scans", type=int, default=200)
+    parser.add_argument("--strategies", nargs="+", default=["none", *PARTITION_BY])
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    categories = [f"categoria_{i}" for i in range(args.categories)]
+    for strategy in args.strategies:
+        result = run(engine, strategy, args.rows, categories, args.partitions, args.scans)
+        print(
+            f"{strategy:>14}: carga {result['bulk_load_s']:>7.2f} s  "
+            f"1000 inserts {result['inserts_s']:>6.3f} s  "
+            f"scan por categoria {result['scan_ms']:>7.2f} ms"
+        )
+    engine.dispose()
+
+if __name__ == "__main__":
+    main()
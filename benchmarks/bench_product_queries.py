@@ -0,0 +1,65 @@
+"""Benchmark do custo de CPU por requisição nos caminhos quentes do ProductQuery.
+
+Compara a query ORM montada a cada chamada (`db.query(...).filter(...)`, como
+era antes) com os statements pré-montados do ProductQuery, retornando
+instâncias ORM ou Rows do Core (`lightweight=True`). Cada medida inclui a
+serialização para o schema Product, como acontece no endpoint.
+
+Uso:
+    poetry run python -m benchmarks.bench_product_queries --url sqlite:// --products 200
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.product import Product as ProductModel
+from app.schemas.product import Product
+from app.services.product import ProductQuery
+
+def bench(label: str, fn, iterations: int) -> None:
+    fn()
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.process_time() - start
+    print(f"{label:>32}: {elapsed / iterations * 1_000_000:>8.1f} µs CPU/req")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="sqlite://", help="banco descartável (a tabela products é criada e apagada)")
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    ProductModel.__table__.create(engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    now = datetime.now(timezone.utc)
+    with Session() as db:
+        db.add_all([
+            ProductModel(id=uuid.uuid4(), created_at=now, updated_at=now, name=f"Produto {i}", category=f"Categoria {i % 10}", price=10.0 + i, amount=i)
+            for i in range(args.products)
+        ])
+        db.commit()
+
+    try:
+        with Session() as db:
+            name = "Produto 1"
+            bench("select db.query (antes)", lambda: Product.model_validate(db.query(ProductModel).filter(ProductModel.name == name).first()), args.iterations)
+            bench("select ProductQuery ORM", lambda: Product.model_validate(ProductQuery(db=db).select_product(name)), args.iterations)
+            bench("select ProductQuery lightweight", lambda: Product.model_validate(ProductQuery(db=db, lightweight=True).select_product(name)), args.iterations)
+
+            iterations = max(args.iterations // 50, 1)
+            bench("list db.query (antes)", lambda: [Product.model_validate(p) for p in db.query(ProductModel).all()], iterations)
+            bench("list ProductQuery ORM", lambda: [Product.model_validate(p) for p in ProductQuery(db=db).get_all_products()], iterations)
+            bench("list ProductQuery lightweight", lambda: [Product.model_validate(p) for p in ProductQuery(db=db, lightweight=True).get_all_products()], iterations)
+    finally:
+        ProductModel.__table__.drop(engine)
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ import app.services.product as service_module
 
 from app.core import security
 from app.api import deps
+from app.services.jobs import JobRunner
 
 
 # Base separada para testes
@@ -134,6 +135,25 @@ def authenticated_client(db_session: Session, test_user):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def job_runner(db_session: Session):
+    # Jobs usam o mesmo banco em memória do teste
+    runner = JobRunner(
+        session_factory=sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind()),
+        max_workers=1,
+        max_pending=10,
+        retention=10,
+    )
+    yield runner
+    runner.shutdown()
+
+
+@pytest.fixture(scope="function")
+def job_client(authenticated_client, job_runner: JobRunner):
+    app.dependency_overrides[deps.get_job_runner] = lambda: job_runner
+    yield authenticated_client
+
+
 @pytest.fixture
 def auth_token(test_user):
     from app.core import security
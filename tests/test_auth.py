@@ -1,9 +1,11 @@
+import time
 import pytest
 from fastapi import status
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.core import security
+from app.core.token_cache import VerifiedTokenCache
 
 
 class TestAuthEndpoint:
@@ -58,3 +60,61 @@ class TestAuthEndpoint:
 
         assert protected_response.status_code != status.HTTP_401_UNAUTHORIZED
 
+
+class TestVerifiedTokenCache:
+    def test_decode_uses_cache(self, auth_token, monkeypatch):
+        security.token_cache.clear()
+        calls = []
+        decode = security.jwt_backend.decode
+
+        def counting_decode(*args, **kwargs):
+            calls.append(1)
+            return decode(*args, **kwargs)
+
+        monkeypatch.setattr(security.jwt_backend, "decode", counting_decode)
+
+        first = security.decode_access_token(auth_token)
+        second = security.decode_access_token(auth_token)
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_invalid_token_is_rejected(self, client):
+        headers = {"Authorization": "Bearer token-invalido"}
+        response = client.get("/api/v1/products", headers=headers)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_expired_entry_is_evicted(self):
+        cache = VerifiedTokenCache(maxsize=10)
+        cache.put("token", {"sub": "1"}, time.time() - 1)
+
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = VerifiedTokenCache(maxsize=2)
+        expires_at = time.time() + 60
+        cache.put("a", {"sub": "1"}, expires_at)
+        cache.put("b", {"sub": "2"}, expires_at)
+        cache.get("a")
+        cache.put("c", {"sub": "3"}, expires_at)
+
+        assert cache.get("a") == {"sub": "1"}
+        assert cache.get("b") is None
+        assert cache.get("c") == {"sub": "3"}
+
+    def test_token_without_exp_is_not_cached(self):
+        cache = VerifiedTokenCache(maxsize=10)
+        cache.put("token", {"sub": "1"}, None)
+
+        assert cache.get("token") is None
+
+    def test_pyjwt_backend(self):
+        pytest.importorskip("jwt")
+        backend = security.PyJWTBackend()
+        token = backend.encode({"sub": "1", "exp": time.time() + 60}, "segredo", algorithm="HS256")
+
+        assert backend.decode(token, "segredo", algorithms=["HS256"])["sub"] == "1"
+        with pytest.raises(security.TokenError):
+            backend.decode(token, "outro-segredo", algorithms=["HS256"])
@@ -0,0 +1,181 @@
+import json
+import os
+import time
+import uuid
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from tests.conftest import ProductTest
+from app.core.config import settings
+from app.services.jobs import JobRunner
+from app.schemas.job import JobStatus
+from app.schemas.product import ProductCreate
+from app.services.product import ProductQuery
+
+
+def wait_for_job(client, job_id: str, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/v1/jobs/{job_id}").json()
+        if job["status"] in (JobStatus.succeeded, JobStatus.failed):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} não terminou em {timeout}s")
+
+
+def wait_for_runner_job(runner: JobRunner, job_id: uuid.UUID, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = runner.get(job_id)
+        if job.status in (JobStatus.succeeded, JobStatus.failed):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} não terminou em {timeout}s")
+
+
+class TestJobRunner:
+    def test_successful_job(self, job_runner: JobRunner):
+        job = job_runner.submit("teste", lambda db, progress: {"ok": True})
+
+        result = wait_for_runner_job(job_runner, job.id)
+        assert result.status == JobStatus.succeeded
+        assert result.progress == 1.0
+        assert result.result == {"ok": True}
+
+    def test_failed_job(self, job_runner: JobRunner):
+        def failing_job(db, progress):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Falha no job")
+
+        job = job_runner.submit("teste", failing_job)
+
+        result = wait_for_runner_job(job_runner, job.id)
+        assert result.status == JobStatus.failed
+        assert result.error == "Falha no job"
+
+    def test_cleanup_runs_when_job_expires(self, job_runner: JobRunner):
+        cleaned = []
+        job = job_runner.submit("teste", lambda db, progress: {"file": "a.jsonl"}, cleanup=cleaned.append)
+        wait_for_runner_job(job_runner, job.id)
+
+        job_runner.retention_seconds = 0
+        with pytest.raises(HTTPException):
+            job_runner.get(job.id)
+
+        assert cleaned == [{"file": "a.jsonl"}]
+
+    def test_cleanup_runs_on_shutdown(self, job_runner: JobRunner):
+        cleaned = []
+        job = job_runner.submit("teste", lambda db, progress: {"file": "a.jsonl"}, cleanup=cleaned.append)
+        wait_for_runner_job(job_runner, job.id)
+
+        job_runner.shutdown()
+
+        assert cleaned == [{"file": "a.jsonl"}]
+
+    def test_job_not_found(self, job_runner: JobRunner):
+        with pytest.raises(HTTPException) as exc_info:
+            job_runner.get(uuid.uuid4())
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestJobEndpoints:
+    def test_import_products(self, job_client, db_session: Session, sample_product_data):
+        products = [{**sample_product_data, "name": f"Produto {i}"} for i in range(5)]
+        response = job_client.post("/api/v1/jobs/products/import", json={"products": products})
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = wait_for_job(job_client, response.json()["id"])
+        assert job["status"] == JobStatus.succeeded
+        assert job["result"] == {"imported": 5}
+        assert db_session.query(ProductTest).count() == 5
+
+    def test_import_products_is_atomic(self, db_session: Session, sample_product_data, monkeypatch):
+        monkeypatch.setattr(settings, "JOB_BATCH_SIZE", 2)
+        flush = db_session.flush
+        calls = []
+
+        def failing_flush(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise IntegrityError("INSERT", {}, Exception("duplicado"))
+            return flush(*args, **kwargs)
+
+        monkeypatch.setattr(db_session, "flush", failing_flush)
+        products = [ProductCreate(**{**sample_product_data, "name": f"Produto {i}"}) for i in range(5)]
+
+        with pytest.raises(HTTPException) as exc_info:
+            ProductQuery(db=db_session).import_products(products)
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert "rolled back" in exc_info.value.detail
+        monkeypatch.undo()
+        assert db_session.query(ProductTest).count() == 0
+
+    def test_export_products(self, job_client, job_runner: JobRunner, db_session: Session, sample_product_data, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "JOB_EXPORT_DIR", str(tmp_path))
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.commit()
+
+        response = job_client.post("/api/v1/jobs/products/export")
+
+        job = wait_for_job(job_client, response.json()["id"])
+        assert job["status"] == JobStatus.succeeded
+        assert job["result"]["rows"] == 1
+        assert job["result"]["file"] == os.path.basename(job["result"]["file"])
+        download = job_client.get(f"/api/v1/jobs/{job['id']}/file")
+        assert download.status_code == status.HTTP_200_OK
+        lines = download.text.splitlines()
+        assert json.loads(lines[0])["name"] == "Produto Teste"
+        assert job["result"]["size"] == len(download.content)
+
+        job_runner.shutdown()
+        assert os.listdir(tmp_path) == []
+
+    def test_job_file_only_for_export_jobs(self, job_client, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.commit()
+
+        response = job_client.post("/api/v1/jobs/products/stats")
+        job = wait_for_job(job_client, response.json()["id"])
+
+        download = job_client.get(f"/api/v1/jobs/{job['id']}/file")
+        assert download.status_code == status.HTTP_404_NOT_FOUND
+        assert download.json()["detail"] == "Export file not found"
+
+    def test_product_stats(self, job_client, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.add(ProductTest(**{**sample_product_data, "name": "Produto Teste 2", "amount": 5}))
+        db_session.commit()
+
+        response = job_client.post("/api/v1/jobs/products/stats")
+
+        job = wait_for_job(job_client, response.json()["id"])
+        assert job["status"] == JobStatus.succeeded
+        assert job["result"][0]["category"] == "Categoria Teste"
+        assert job["result"][0]["products"] == 2
+        assert job["result"][0]["amount"] == 15
+
+    def test_adjust_prices(self, job_client, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**{**sample_product_data, "price": 100.0}))
+        db_session.commit()
+
+        response = job_client.post("/api/v1/jobs/products/prices", json={"percentage": 10})
+
+        job = wait_for_job(job_client, response.json()["id"])
+        assert job["status"] == JobStatus.succeeded
+        assert job["result"] == {"updated": 1}
+        db_session.expire_all()
+        assert db_session.query(ProductTest).one().price == pytest.approx(110.0)
+
+    def test_get_job_not_found(self, job_client):
+        response = job_client.get(f"/api/v1/jobs/{uuid.uuid4()}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_jobs_unauthorized(self, client):
+        response = client.post("/api/v1/jobs/products/export")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,67 @@
+import pytest
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from tests.conftest import ProductTest
+from app.db.partitioning import category_partition_statements, hash_partition_statements, partition_name, quote_literal
+from app.services.product import ProductQuery
+
+
+class TestPartitioningDDL:
+    def test_hash_partition_statements(self):
+        statements = hash_partition_statements("products", 4)
+
+        assert len(statements) == 4
+        assert 'PARTITION OF "products"' in statements[0]
+        assert "MODULUS 4, REMAINDER 3" in statements[3]
+
+    def test_partition_name_is_valid_identifier(self):
+        name = partition_name("products", "Eletrônicos & Informática " * 5)
+
+        assert name.startswith("products_eletr")
+        assert len(name) <= 63
+        assert partition_name("products", "A") != partition_name("products", "a")
+
+    def test_category_partition_statements_move_rows_from_default(self):
+        statements = category_partition_statements("products", "Livros")
+
+        assert statements[0] == 'ALTER TABLE "products" DETACH PARTITION "products_default"'
+        assert "FOR VALUES IN ('Livros')" in statements[4]
+        assert statements[-1] == 'ALTER TABLE "products" ATTACH PARTITION "products_default" DEFAULT'
+
+    def test_quote_literal_escapes_quotes(self):
+        assert quote_literal("D'Ávila") == "'D''Ávila'"
+
+
+class TestCategoryFilteredReads:
+    def test_get_all_products_by_category(self, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.add(ProductTest(**{**sample_product_data, "name": "Outro Produto", "category": "Outra Categoria"}))
+        db_session.commit()
+
+        service = ProductQuery(db=db_session)
+        result = service.get_all_products(category="Outra Categoria")
+
+        assert len(result) == 1
+        assert result[0].name == "Outro Produto"
+
+    def test_select_product_with_wrong_category(self, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.commit()
+
+        service = ProductQuery(db=db_session)
+
+        with pytest.raises(Exception) as exc_info:
+            service.select_product("Produto Teste", category="Outra Categoria")
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_products_by_category_endpoint(self, authenticated_client, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.add(ProductTest(**{**sample_product_data, "name": "Outro Produto", "category": "Outra Categoria"}))
+        db_session.commit()
+
+        response = authenticated_client.get("/api/v1/products?category=Categoria Teste")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["name"] for p in response.json()] == ["Produto Teste"]
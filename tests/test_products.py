@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 
 from tests.conftest import ProductTest
 from app.services.product import ProductQuery
-from app.schemas.product import ProductCreate
+from app.schemas.product import Product, ProductCreate
 
 
 class TestProductService:
@@ -124,6 +124,30 @@ class TestProductService:
         
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_select_product_lightweight(self, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.commit()
+
+        service = ProductQuery(db=db_session, lightweight=True)
+        result = service.select_product("Produto Teste")
+
+        assert not isinstance(result, ProductTest)
+        assert result.name == "Produto Teste"
+        assert result.price == 99.99
+
+    def test_get_all_products_lightweight(self, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.commit()
+
+        service = ProductQuery(db=db_session, lightweight=True)
+        result = service.get_all_products()
+
+        assert len(result) == 1
+        assert Product.model_validate(result[0]).name == "Produto Teste"
+
+    def test_statements_are_reused(self, db_session: Session):
+        assert ProductQuery(db=db_session).statements is ProductQuery(db=db_session).statements
+
 
 class TestProductEndpoints:
     def test_get_all_products_success(self, authenticated_client, db_session: Session, sample_product_data):
@@ -0,0 +1,207 @@
+import asyncio
+import threading
+import time
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from tests.conftest import ProductTest, TestBase
+from app.core.singleflight import SingleFlight
+from app.services.product import ProductQuery, product_reads
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_execution(self):
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_query():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "resultado"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("chave", slow_query)))
+        leader.start()
+        started.wait(timeout=5)
+        followers = [threading.Thread(target=lambda: results.append(flight.do("chave", slow_query))) for _ in range(10)]
+        for t in followers:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in [leader, *followers]:
+            t.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == ["resultado"] * 11
+        assert flight.in_flight() == 0
+
+    def test_error_propagates_to_followers(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_query():
+            started.set()
+            release.wait(timeout=5)
+            raise ValueError("falha")
+
+        errors = []
+
+        def call():
+            try:
+                flight.do("chave", failing_query)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(timeout=5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+        assert len(errors) == 2
+        assert flight.in_flight() == 0
+
+    def test_followers_get_their_own_exception(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def missing_product():
+            started.set()
+            release.wait(timeout=5)
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+
+        errors = []
+
+        def call():
+            try:
+                flight.do("chave", missing_product)
+            except HTTPException as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(timeout=5)
+        followers = [threading.Thread(target=call) for _ in range(10)]
+        for t in followers:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in [leader, *followers]:
+            t.join(timeout=5)
+
+        assert len(errors) == 11
+        assert len({id(e) for e in errors}) == 11
+        assert all(e.status_code == status.HTTP_404_NOT_FOUND and e.detail == "Product not found" for e in errors)
+
+    def test_follower_timeout(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_query():
+            started.set()
+            release.wait(timeout=5)
+            return "resultado"
+
+        leader = threading.Thread(target=lambda: flight.do("chave", slow_query))
+        leader.start()
+        started.wait(timeout=5)
+
+        with pytest.raises(TimeoutError):
+            flight.do("chave", slow_query, timeout=0.01)
+
+        release.set()
+        leader.join(timeout=5)
+
+    def test_calls_after_completion_are_not_cached(self):
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        assert flight.do("chave", lambda: next(counter)) == 0
+        assert flight.do("chave", lambda: next(counter)) == 1
+
+    def test_async_calls_share_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        def slow_query():
+            calls.append(1)
+            time.sleep(0.05)
+            return "resultado"
+
+        async def run():
+            return await asyncio.gather(*(flight.do_async("chave", slow_query) for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == ["resultado"] * 10
+
+
+class TestProductReadCoalescing:
+    def test_select_product_coalesced_success(self, db_session: Session, sample_product_data):
+        db_session.add(ProductTest(**sample_product_data))
+        db_session.commit()
+
+        service = ProductQuery(db=db_session)
+        result = service.select_product_coalesced("Produto Teste")
+
+        assert result.name == "Produto Teste"
+        assert result.price == 99.99
+
+    def test_select_product_coalesced_not_found(self, db_session: Session):
+        service = ProductQuery(db=db_session)
+
+        with pytest.raises(Exception) as exc_info:
+            service.select_product_coalesced("Produto Inexistente")
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_follower_releases_connection_while_waiting(self, tmp_path, sample_product_data):
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", connect_args={"check_same_thread": False})
+        TestBase.metadata.create_all(bind=engine)
+        db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        db.add(ProductTest(**sample_product_data))
+        db.commit()
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocked_leader():
+            started.set()
+            release.wait(timeout=5)
+            return "resultado"
+
+        leader = threading.Thread(target=lambda: product_reads.do(("select_product", "Produto Teste", None), blocked_leader))
+        leader.start()
+        started.wait(timeout=5)
+
+        # Simula a consulta de autenticação, que deixa a conexão da requisição em uso
+        db.query(ProductTest).first()
+        assert engine.pool.checkedout() == 1
+
+        results = []
+        follower = threading.Thread(target=lambda: results.append(ProductQuery(db=db).select_product_coalesced("Produto Teste")))
+        follower.start()
+        time.sleep(0.05)
+        try:
+            assert engine.pool.checkedout() == 0
+        finally:
+            release.set()
+            leader.join(timeout=5)
+            follower.join(timeout=5)
+            db.close()
+            engine.dispose()
+
+        assert results == ["resultado"]